@@ -1,6 +1,13 @@
+import argparse
+import contextlib
+import csv
+import functools
 import os
-import random
-import string
+import sys
+import time
+from collections import OrderedDict
+
+from song_generator import SongGenerator
 
 # Klasse, die ein Lied mit Titel, Künstler und Album darstellt
 class Song:
@@ -165,20 +172,208 @@ class RedBlackTree:
         x.parent = y
 
     def search(self, song):
-        """Suche nach einem Lied im Rot-Schwarz-Baum."""
+        """Suche nach einem Lied mit demselben Titel im Rot-Schwarz-Baum."""
         # Starte die rekursive Suche nach dem Lied
-        result = self._search_recursive(self.root, song)
+        return self._search_recursive(self.root, song)
 
     def _search_recursive(self, node, song):
         """Hilfsmethode für die rekursive Suche."""
-        # Falls der Knoten das Lied enthält oder der NIL-Knoten erreicht wurde, kehre zurück
-        if node == self.NIL or node.song == song:
+        # Der Baum ist zuerst nach Titel geordnet, daher genügt der Vergleich der Titel
+        if node == self.NIL or node.song.title == song.title:
             return node != self.NIL
-        # Wenn das gesuchte Lied kleiner ist, gehe nach links, ansonsten nach rechts
-        if song < node.song:
+        # Wenn der gesuchte Titel kleiner ist, gehe nach links, ansonsten nach rechts
+        if song.title < node.song.title:
             return self._search_recursive(node.left, song)
         return self._search_recursive(node.right, song)
 
+    def delete(self, song):
+        """Entferne genau dieses Lied-Objekt aus dem Rot-Schwarz-Baum."""
+        node = self._find_node(self.root, song)
+        if node is None:
+            return False
+
+        # Entfernen nach dem Verfahren aus Cormen et al. (Introduction to Algorithms)
+        removed = node
+        removed_color = removed.color
+        if node.left == self.NIL:
+            child = node.right
+            self._transplant(node, node.right)
+        elif node.right == self.NIL:
+            child = node.left
+            self._transplant(node, node.left)
+        else:
+            # Der Nachfolger (kleinstes Element rechts) nimmt den Platz des Knotens ein
+            removed = self._minimum(node.right)
+            removed_color = removed.color
+            child = removed.right
+            if removed.parent == node:
+                child.parent = removed
+            else:
+                self._transplant(removed, removed.right)
+                removed.right = node.right
+                removed.right.parent = removed
+            self._transplant(node, removed)
+            removed.left = node.left
+            removed.left.parent = removed
+            removed.color = node.color
+
+        # Nur das Entfernen eines schwarzen Knotens kann die Eigenschaften verletzen
+        if removed_color == "BLACK":
+            self.fix_delete(child)
+        return True
+
+    def fix_delete(self, node):
+        """Korrigiere den Rot-Schwarz-Baum nach dem Entfernen."""
+        while node != self.root and node.color == "BLACK":
+            if node == node.parent.left:
+                sibling = node.parent.right
+                if sibling.color == "RED":
+                    # Fall 1: Geschwister ist rot, färbe um und rotiere nach links
+                    sibling.color = "BLACK"
+                    node.parent.color = "RED"
+                    self.left_rotate(node.parent)
+                    sibling = node.parent.right
+                if sibling.left.color == "BLACK" and sibling.right.color == "BLACK":
+                    # Fall 2: Beide Kinder des Geschwisters sind schwarz
+                    sibling.color = "RED"
+                    node = node.parent
+                else:
+                    if sibling.right.color == "BLACK":
+                        # Fall 3: Nur das linke Kind des Geschwisters ist rot
+                        sibling.left.color = "BLACK"
+                        sibling.color = "RED"
+                        self.right_rotate(sibling)
+                        sibling = node.parent.right
+                    # Fall 4: Das rechte Kind des Geschwisters ist rot
+                    sibling.color = node.parent.color
+                    node.parent.color = "BLACK"
+                    sibling.right.color = "BLACK"
+                    self.left_rotate(node.parent)
+                    node = self.root
+            else:
+                # Spiegelbildliche Fälle für das rechte Kind
+                sibling = node.parent.left
+                if sibling.color == "RED":
+                    sibling.color = "BLACK"
+                    node.parent.color = "RED"
+                    self.right_rotate(node.parent)
+                    sibling = node.parent.left
+                if sibling.right.color == "BLACK" and sibling.left.color == "BLACK":
+                    sibling.color = "RED"
+                    node = node.parent
+                else:
+                    if sibling.left.color == "BLACK":
+                        sibling.right.color = "BLACK"
+                        sibling.color = "RED"
+                        self.left_rotate(sibling)
+                        sibling = node.parent.left
+                    sibling.color = node.parent.color
+                    node.parent.color = "BLACK"
+                    sibling.left.color = "BLACK"
+                    self.right_rotate(node.parent)
+                    node = self.root
+
+        node.color = "BLACK"
+
+    def _transplant(self, old, new):
+        """Ersetze den Teilbaum unter old durch den Teilbaum unter new."""
+        if old.parent is None:
+            self.root = new
+        elif old == old.parent.left:
+            old.parent.left = new
+        else:
+            old.parent.right = new
+        new.parent = old.parent
+
+    def _minimum(self, node):
+        """Finde den Knoten mit dem kleinsten Lied im Teilbaum."""
+        while node.left != self.NIL:
+            node = node.left
+        return node
+
+    def _find_node(self, node, song):
+        """Finde den Knoten, der genau dieses Lied-Objekt enthält."""
+        if node == self.NIL:
+            return None
+        if node.song is song:
+            return node
+        if song < node.song:
+            return self._find_node(node.left, song)
+        if node.song < song:
+            return self._find_node(node.right, song)
+        # Gleiche Lieder können nach Rotationen in beiden Teilbäumen liegen
+        return self._find_node(node.left, song) or self._find_node(node.right, song)
+
+# LRU-Cache für Suchergebnisse
+class SearchCache:
+    """Begrenzter LRU-Cache für Suchergebnisse, der an einen Generationszähler gebunden ist."""
+
+    def __init__(self, maxsize=1024):
+        # Maximale Anzahl gespeicherter Ergebnisse (0 schaltet den Cache ab)
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        # Generation der Bibliothek, zu der die gespeicherten Ergebnisse gehören
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key, generation):
+        """Gib (True, Ergebnis) bei einem Treffer zurück, sonst (False, None)."""
+        # Nach einer Änderung der Bibliothek sind alle gespeicherten Positionen ungültig
+        if generation != self.generation:
+            self.invalidate(generation)
+        if key in self.entries:
+            # Markiere den Eintrag als zuletzt verwendet
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return True, self.entries[key]
+        self.misses += 1
+        return False, None
+
+    def put(self, key, value, generation):
+        """Speichere ein Ergebnis und verdränge bei Bedarf den ältesten Eintrag."""
+        if self.maxsize <= 0 or generation != self.generation:
+            return
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, generation):
+        """Verwirf alle Einträge und übernimm die neue Generation."""
+        if self.entries:
+            self.entries.clear()
+            self.invalidations += 1
+        self.generation = generation
+
+    def stats(self):
+        """Gib die Statistiken des Caches als Dictionary zurück."""
+        return {
+            "size": len(self.entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+def cached_search(method):
+    """Dekorator, der eine Suchmethode der Bibliothek über den Such-Cache ausführt."""
+    @functools.wraps(method)
+    def wrapper(self, title):
+        key = (method.__name__, title)
+        found, result = self.search_cache.get(key, self.generation)
+        if found:
+            return result
+        result = method(self, title)
+        self.search_cache.put(key, result, self.generation)
+        return result
+    return wrapper
+
 # Klasse für die Musikbibliothek
 class MusicLibrary:
     """Musikbibliothek zur Verwaltung von Liedern."""
@@ -187,11 +382,17 @@ class MusicLibrary:
     FILENAME = "songs.csv"
     FAVORITES_FILENAME = "favoriten.csv"
 
-    def __init__(self):
+    # Standardgröße des Such-Caches
+    CACHE_SIZE = 1024
+
+    def __init__(self, cache_size=CACHE_SIZE):
         # Initialisiert die Bibliothek mit einer Liste von Liedern und Favoriten
         self.songs = []
         self.favorites = []
         self.rbt = RedBlackTree()
+        # Der Generationszähler wird bei jeder Änderung der Liederliste erhöht
+        self.generation = 0
+        self.search_cache = SearchCache(cache_size)
         self.load_songs()  # Läd die Lieder aus der Datei
         self.load_favorites()  # Läd die Favoriten aus der Datei
 
@@ -207,6 +408,7 @@ class MusicLibrary:
                             song = Song(title, artist, album)
                             self.songs.append(song)
                             self.rbt.insert(song)
+                self.generation += 1
                 print(f"{len(self.songs)} Lieder aus {self.FILENAME} geladen.")
             else:
                 print("Keine Lieder gefunden. Beginne mit einer leeren Bibliothek.")
@@ -221,16 +423,20 @@ class MusicLibrary:
                 file.write(f"{song.title},{song.artist},{song.album}\n")
         print(f"{len(self.songs)} Lieder in {self.FILENAME} gespeichert.")
 
-    def add_song(self, title, artist, album):
+    def add_song(self, title, artist, album, save=True):
         """Füge ein neues Lied zur Bibliothek hinzu."""
         # Erstelle ein neues Song-Objekt und füge es der Bibliothek hinzu
         song = Song(title, artist, album)
         self.songs.append(song)
         self.rbt.insert(song)
-        self.save_songs()
+        self.generation += 1
+        # Mit save=False übernimmt der Aufrufer das Speichern (z. B. der Batch-Modus)
+        if save:
+            self.save_songs()
         print(f"'{song}' wurde deiner Musikbibliothek hinzugefügt.")
+        return song
 
-    def delete_song(self, title):
+    def delete_song(self, title, save=True):
         """Lösche ein Lied nach Titel."""
         # Suche das Lied mit dem angegebenen Titel in der Bibliothek
         song_to_delete = next((s for s in self.songs if s.title == title), None)
@@ -238,12 +444,16 @@ class MusicLibrary:
         if song_to_delete:
             # Wenn das Lied gefunden wurde, entferne es aus der Bibliothek
             self.songs.remove(song_to_delete)
+            self.rbt.delete(song_to_delete)
+            self.generation += 1
             # Speichere die aktualisierte Liste der Lieder
-            self.save_songs()
+            if save:
+                self.save_songs()
             print(f"'{song_to_delete}' wurde aus deiner Musikbibliothek entfernt.")
         else:
             # Wenn das Lied nicht gefunden wurde, gib eine entsprechende Nachricht aus
             print(f"'{title}' wurde in deiner Musikbibliothek nicht gefunden.")
+        return song_to_delete
 
     def display_songs(self):
         """Zeige alle Lieder in der Bibliothek an."""
@@ -256,6 +466,7 @@ class MusicLibrary:
             # Wenn keine Lieder vorhanden sind, zeige eine Nachricht an
             print("Deine Musikbibliothek ist leer.")
 
+    @cached_search
     def linear_search(self, title):
         """Lineare Suche nach einem Titel mit Laufzeitmessung."""
         # Durchsuche die Bibliothek linear (sequentiell), um ein Lied mit dem angegebenen Titel zu finden
@@ -266,6 +477,7 @@ class MusicLibrary:
         # Wenn das Lied nicht gefunden wurde, gib -1 zurück
         return -1
 
+    @cached_search
     def binary_search(self, title):
         """Binäre Suche mit dem Rot-Schwarz-Baum."""
         # Erstelle ein temporäres Song-Objekt mit dem gesuchten Titel
@@ -275,6 +487,7 @@ class MusicLibrary:
         # Gib das Ergebnis der Suche zurück (True oder False)
         return found
 
+    @cached_search
     def interpolation_search(self, title):
         """Interpolation Search Algorithmus für eine sortierte Liste mit Zeitmessung."""
         low = 0
@@ -306,6 +519,7 @@ class MusicLibrary:
         # Wenn das Lied nicht gefunden wurde, gib -1 zurück
         return -1
 
+    @cached_search
     def exponential_search(self, title):
         """Exponential Search Algorithmus für eine sortierte Liste mit Zeitmessung."""
         if len(self.songs) == 0:
@@ -339,7 +553,7 @@ class MusicLibrary:
         # Wenn das Lied nicht gefunden wurde, gib -1 zurück
         return -1
 
-    def bubble_sort(self):
+    def bubble_sort(self, save=True):
         """Bubble Sort Algorithmus mit Laufzeitmessung."""
         # Anzahl der Lieder in der Bibliothek
         n = len(self.songs)
@@ -353,10 +567,13 @@ class MusicLibrary:
             # Wenn keine Vertauschungen vorgenommen wurden, ist die Liste sortiert
             if not swapped:
                 break
+        # Sortieren verschiebt die Positionen, daher werden gespeicherte Suchergebnisse ungültig
+        self.generation += 1
         # Speichere die sortierten Lieder
-        self.save_songs()
+        if save:
+            self.save_songs()
 
-    def insertion_sort(self):
+    def insertion_sort(self, save=True):
         """Insertion Sort Algorithmus mit Laufzeitmessung."""
         # Iteriere über die Lieder und füge sie sortiert in die Liste ein
         for i in range(1, len(self.songs)):
@@ -368,8 +585,11 @@ class MusicLibrary:
                 j -= 1
             # Setze das aktuelle Lied an die richtige Position
             self.songs[j + 1] = key_song
+        # Sortieren verschiebt die Positionen, daher werden gespeicherte Suchergebnisse ungültig
+        self.generation += 1
         # Speichere die sortierten Lieder
-        self.save_songs()
+        if save:
+            self.save_songs()
 
     def merge_sort(self, array=None):
         """Merge Sort Algorithmus mit Laufzeitmessung."""
@@ -407,14 +627,17 @@ class MusicLibrary:
         result.extend(right[j:])
         return result
 
-    def sort_with_merge_sort(self):
+    def sort_with_merge_sort(self, save=True):
         """Führt Merge Sort durch und misst die Zeit."""
         # Sortiere die Bibliothek mit Merge Sort
         self.songs = self.merge_sort()
+        # Sortieren verschiebt die Positionen, daher werden gespeicherte Suchergebnisse ungültig
+        self.generation += 1
         # Speichere die sortierten Lieder
-        self.save_songs()
+        if save:
+            self.save_songs()
 
-    def heap_sort(self):
+    def heap_sort(self, save=True):
         """Heap Sort Algorithmus mit Laufzeitmessung."""
         n = len(self.songs)
 
@@ -426,8 +649,11 @@ class MusicLibrary:
         for i in range(n - 1, 0, -1):
             self.songs[i], self.songs[0] = self.songs[0], self.songs[i]
             self._heapify(i, 0)
+        # Sortieren verschiebt die Positionen, daher werden gespeicherte Suchergebnisse ungültig
+        self.generation += 1
         # Speichere die sortierten Lieder
-        self.save_songs()
+        if save:
+            self.save_songs()
 
     def _heapify(self, n, i):
         """Hilfsmethode zur Umstrukturierung eines Heaps."""
@@ -449,14 +675,15 @@ class MusicLibrary:
 
     def create_random_songs(self, count):
         """Erstelle zufällige Lieder."""
-        # Erstelle eine bestimmte Anzahl von zufälligen Liedern
-        for _ in range(count):
-            # Generiere einen zufälligen Titel, Künstler und Albumname aus Großbuchstaben
-            title = ''.join(random.choices(string.ascii_uppercase, k=random.randint(5, 10)))
-            artist = ''.join(random.choices(string.ascii_uppercase, k=random.randint(5, 10)))
-            album = ''.join(random.choices(string.ascii_uppercase, k=random.randint(5, 10)))
-            # Füge das zufällig generierte Lied der Bibliothek hinzu
-            self.add_song(title, artist, album)
+        # Erstelle eine bestimmte Anzahl von zufälligen Liedern aus Großbuchstaben
+        for title, artist, album in SongGenerator().generate(count):
+            # Füge die Lieder gesammelt hinzu, ohne Speichern und Ausgabe pro Lied
+            song = Song(title, artist, album)
+            self.songs.append(song)
+            self.rbt.insert(song)
+        self.generation += 1
+        self.save_songs()
+        print(f"{count} zufällige Lieder wurden deiner Musikbibliothek hinzugefügt.")
 
     def load_favorites(self):
         """Lade Favoriten aus der Datei."""
@@ -484,7 +711,7 @@ class MusicLibrary:
         # Gib die Anzahl der gespeicherten Favoriten aus
         print(f"{len(self.favorites)} Favoriten in {self.FAVORITES_FILENAME} gespeichert.")
 
-    def add_favorite(self, title):
+    def add_favorite(self, title, save=True):
         """Füge ein Lied zu den Favoriten hinzu, wenn es in der Bibliothek vorhanden ist."""
         try:
             # Suche nach einem Lied mit dem angegebenen Titel in der Bibliothek
@@ -494,8 +721,10 @@ class MusicLibrary:
                 # Füge das Lied zu den Favoriten hinzu
                 self.favorites.append(song_to_add)
                 # Speichere die aktualisierten Favoriten
-                self.save_favorites()
+                if save:
+                    self.save_favorites()
                 print(f"'{song_to_add}' wurde zu deinen Favoriten hinzugefügt.")
+                return song_to_add
             elif song_to_add in self.favorites:
                 # Falls das Lied bereits in den Favoriten ist
                 print(f"'{title}' ist bereits in den Favoriten.")
@@ -505,8 +734,9 @@ class MusicLibrary:
         except Exception as e:
             # Gib eine Fehlermeldung aus, falls beim Hinzufügen ein Fehler auftritt
             print(f"Fehler beim Hinzufügen zu Favoriten: {e}")
+        return None
 
-    def remove_favorite(self, title):
+    def remove_favorite(self, title, save=True):
         """Entferne ein Lied aus den Favoriten."""
         # Suche nach einem Lied mit dem angegebenen Titel in der Favoritenliste
         song_to_remove = next((s for s in self.favorites if s.title == title), None)
@@ -514,11 +744,13 @@ class MusicLibrary:
             # Entferne das Lied, wenn es in den Favoriten gefunden wurde
             self.favorites.remove(song_to_remove)
             # Speichere die aktualisierte Favoritenliste
-            self.save_favorites()
+            if save:
+                self.save_favorites()
             print(f"'{song_to_remove}' wurde aus deinen Favoriten entfernt.")
         else:
             # Falls das Lied nicht in den Favoriten gefunden wurde
             print(f"'{title}' wurde in deinen Favoriten nicht gefunden.")
+        return song_to_remove
 
     def display_favorites(self):
         """Zeige alle Favoriten an."""
@@ -683,11 +915,150 @@ def manage_favorites(library=MusicLibrary):
         else:
             print("Ungültige Option.")  # Warnung bei ungültiger Eingabe
 
+# Batch-Modus
+
+# Zuordnung der Batch-Argumente zu den Such- und Sortiermethoden der Bibliothek
+SEARCH_METHODS = {
+    "exponential": "exponential_search",
+    "binary": "binary_search",
+    "interpolation": "interpolation_search",
+    "linear": "linear_search",
+}
+SORT_METHODS = {
+    "insertion": "insertion_sort",
+    "merge": "sort_with_merge_sort",
+    "heap": "heap_sort",
+    "bubble": "bubble_sort",
+}
+# Spalten der Ergebnisdatei
+RESULT_FIELDS = ["line", "command", "arguments", "status", "position", "detail", "seconds"]
+
+def parse_batch_line(line):
+    """Zerlege eine Zeile der Befehlsdatei in Befehl und Argumente."""
+    line = line.strip()
+    # Leere Zeilen und Kommentare werden übersprungen
+    if not line or line.startswith('#'):
+        return None
+    # Befehl und Argumente sind wie in songs.csv durch Kommas getrennt
+    parts = [part.strip() for part in line.split(',')]
+    return parts[0].lower(), parts[1:]
+
+def execute_batch_command(library, command, args):
+    """Führe einen Batch-Befehl ohne Speichern aus und gib (Status, Position, Detail, geänderte Liste) zurück."""
+    if command == "add" and len(args) == 3:
+        song = library.add_song(*args, save=False)
+        return "ok", len(library.songs), str(song), "songs"
+    if command == "delete" and len(args) == 1:
+        song = library.delete_song(args[0], save=False)
+        if song:
+            return "ok", "", str(song), "songs"
+        return "not_found", "", "", None
+    if command == "search" and len(args) == 2 and args[0] in SEARCH_METHODS:
+        result = getattr(library, SEARCH_METHODS[args[0]])(args[1])
+        # Die binäre Suche liefert nur True/False, die übrigen Suchen einen Index oder -1
+        if args[0] == "binary":
+            return ("found" if result else "not_found"), "", "", None
+        if result != -1:
+            return "found", result + 1, str(library.songs[result]), None
+        return "not_found", "", "", None
+    if command == "favorite" and len(args) == 1:
+        song = library.add_favorite(args[0], save=False)
+        if song:
+            return "ok", len(library.favorites), str(song), "favorites"
+        # Unterscheide bereits vorhandene Favoriten von Titeln, die nicht in der Bibliothek sind
+        if any(s.title == args[0] for s in library.songs):
+            return "unchanged", "", "", None
+        return "not_found", "", "", None
+    if command == "unfavorite" and len(args) == 1:
+        song = library.remove_favorite(args[0], save=False)
+        if song:
+            return "ok", "", str(song), "favorites"
+        return "not_found", "", "", None
+    if command == "sort" and len(args) == 1 and args[0] in SORT_METHODS:
+        getattr(library, SORT_METHODS[args[0]])(save=False)
+        return "ok", "", "", "songs"
+    raise ValueError(f"Ungültiger Befehl: {','.join([command] + args)}")
+
+def flush_batch(library, dirty):
+    """Speichere alle seit dem letzten Speichern geänderten Listen genau einmal."""
+    if "songs" in dirty:
+        library.save_songs()
+    if "favorites" in dirty:
+        library.save_favorites()
+    dirty.clear()
+
+def run_batch(library, lines, result_filename):
+    """Führe Befehle aus einem Zeilenstrom aus und schreibe die Ergebnisse als CSV."""
+    dirty = set()
+    executed = 0
+    start = time.perf_counter()
+
+    with open(result_filename, 'w', newline='') as result_file, open(os.devnull, 'w') as devnull:
+        writer = csv.writer(result_file)
+        writer.writerow(RESULT_FIELDS)
+        # Die Konsolenausgaben der einzelnen Operationen werden im Batch-Modus verworfen
+        with contextlib.redirect_stdout(devnull):
+            for number, line in enumerate(lines, 1):
+                parsed = parse_batch_line(line)
+                if parsed is None:
+                    continue
+                command, args = parsed
+
+                command_start = time.perf_counter()
+                try:
+                    # Änderungen werden nur am Ende oder bei einem expliziten save-Befehl gespeichert,
+                    # da alle Suchen auf der Bibliothek im Speicher arbeiten
+                    if command == "save" and not args:
+                        flush_batch(library, dirty)
+                        status, position, detail, changed = "ok", "", "", None
+                    else:
+                        status, position, detail, changed = execute_batch_command(library, command, args)
+                except Exception as e:
+                    status, position, detail, changed = "error", "", str(e), None
+                elapsed = time.perf_counter() - command_start
+
+                if changed:
+                    dirty.add(changed)
+                writer.writerow([number, command, ','.join(args), status, position, detail, f"{elapsed:.6f}"])
+                executed += 1
+
+            # Speichere alle noch nicht gespeicherten Änderungen
+            flush_batch(library, dirty)
+
+    duration = time.perf_counter() - start
+    print(f"{executed} Befehle in {duration:.3f} s ausgeführt, Ergebnisse in {result_filename} gespeichert.")
+    stats = library.search_cache.stats()
+    print(f"Such-Cache: {stats['hits']} Treffer, {stats['misses']} Fehlschläge, "
+          f"{stats['evictions']} Verdrängungen, {stats['invalidations']} Invalidierungen.")
+    return executed
+
 # Hauptprogramm
 
-def main():
+def parse_arguments(argv=None):
+    """Lese die Kommandozeilenargumente für den Batch-Modus ein."""
+    parser = argparse.ArgumentParser(description="Musikbibliothek")
+    parser.add_argument("--batch", metavar="DATEI",
+                        help="Befehlsdatei nicht-interaktiv ausführen ('-' liest von stdin)")
+    parser.add_argument("--results", metavar="DATEI", default="ergebnisse.csv",
+                        help="Datei für die Ergebnisse des Batch-Modus (Standard: ergebnisse.csv)")
+    parser.add_argument("--cache-size", metavar="ANZAHL", type=int, default=MusicLibrary.CACHE_SIZE,
+                        help="Maximale Anzahl gespeicherter Suchergebnisse (0 schaltet den Cache ab)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """Hauptprogramm zur Ausführung der Musikbibliothek."""
-    library = MusicLibrary()  # Erstellt ein neues Musikbibliotheksobjekt
+    args = parse_arguments(argv)
+    library = MusicLibrary(args.cache_size)  # Erstellt ein neues Musikbibliotheksobjekt
+
+    if args.batch:
+        # Führe die Befehle ohne Menüs gegen die geladene Bibliothek aus
+        if args.batch == '-':
+            run_batch(library, sys.stdin, args.results)
+        else:
+            with open(args.batch, 'r') as command_file:
+                run_batch(library, command_file, args.results)
+        return
+
     print("Willkommen in deiner Musikbibliothek")  # Begrüßung des Benutzers
 
     while True:
@@ -0,0 +1,252 @@
+import argparse
+import heapq
+import itertools
+import os
+import random
+import shutil
+import string
+import tempfile
+import time
+
+# Zulässige Reihenfolgen der erzeugten Lieder
+ORDERS = ("random", "sorted", "reversed")
+# Anzahl bereits erzeugter Lieder, aus denen Duplikate gezogen werden
+RESERVOIR_SIZE = 10000
+# Feste Blockgröße für die Zufallszahlen, damit das Ergebnis nicht von chunk_size abhängt
+BLOCK_SIZE = 10000
+# Maximale Anzahl gleichzeitig geöffneter Blockdateien beim externen Mischen
+MERGE_FAN_IN = 64
+# Länge der Künstler- und Albennamen (die Titellänge ist konfigurierbar)
+NAME_LENGTHS = range(5, 11)
+
+
+# Klasse für die Erzeugung synthetischer Musikbibliotheken
+class SongGenerator:
+    """Reproduzierbarer Generator für große Mengen zufälliger Lieder.
+
+    Derselbe Seed und dieselbe Anzahl ergeben unabhängig von chunk_size immer dieselbe Bibliothek.
+    """
+
+    def __init__(self, seed=None, artist_count=None, album_count=None, skew=1.0,
+                 min_length=5, max_length=10, duplicate_rate=0.0, order="random",
+                 chunk_size=100000):
+        # Prüfe die Parameter, bevor mit der Erzeugung begonnen wird
+        if min_length < 1 or max_length < min_length:
+            raise ValueError("Die Titellänge muss mindestens 1 sein und min_length <= max_length erfüllen.")
+        if not 0.0 <= duplicate_rate <= 1.0:
+            raise ValueError("Die Duplikatrate muss zwischen 0 und 1 liegen.")
+        if order not in ORDERS:
+            raise ValueError(f"Unbekannte Reihenfolge '{order}', erlaubt sind: {', '.join(ORDERS)}.")
+        if chunk_size < 1:
+            raise ValueError("Die Blockgröße muss mindestens 1 sein.")
+        if skew < 0:
+            raise ValueError("Die Schiefe darf nicht negativ sein.")
+
+        # Eigener Zufallsgenerator, damit derselbe Seed immer dieselbe Bibliothek erzeugt
+        self.rng = random.Random(seed)
+        self.title_lengths = range(min_length, max_length + 1)
+        self.skew = skew
+        self.duplicate_rate = duplicate_rate
+        self.order = order
+        self.chunk_size = chunk_size
+        # Ohne feste Anzahl erhält jedes Lied einen eigenen Künstler bzw. ein eigenes Album
+        self.artists = self._build_pool(self.rng, artist_count)
+        self.albums = self._build_pool(self.rng, album_count)
+        # Basis, aus der für jeden Block ein eigener Zufallsgenerator abgeleitet wird
+        self.block_seed = self.rng.getrandbits(64)
+
+    def _random_strings(self, rng, count, lengths=NAME_LENGTHS):
+        """Erzeuge mehrere zufällige Zeichenketten aus Großbuchstaben in einem Schritt."""
+        lengths = rng.choices(lengths, k=count)
+        # Alle Buchstaben des Blocks werden auf einmal gezogen und danach aufgeteilt
+        letters = ''.join(rng.choices(string.ascii_uppercase, k=sum(lengths)))
+        result = []
+        pos = 0
+        for length in lengths:
+            result.append(letters[pos:pos + length])
+            pos += length
+        return result
+
+    def _build_pool(self, rng, count):
+        """Erzeuge einen Namenspool mit Zipf-verteilten kumulierten Gewichten."""
+        if count is None:
+            return None
+        if count < 1:
+            raise ValueError("Die Anzahl der Künstler bzw. Alben muss mindestens 1 sein.")
+        names = self._random_strings(rng, count)
+        # Der Name auf Rang r wird mit Gewicht 1 / r^skew gewählt (skew=0 bedeutet gleichverteilt)
+        weights = itertools.accumulate(1 / rank ** self.skew for rank in range(1, count + 1))
+        return names, list(weights)
+
+    def _pick(self, rng, pool, count):
+        """Wähle Namen aus einem Pool oder erzeuge neue, falls kein Pool vorhanden ist."""
+        if pool is None:
+            return self._random_strings(rng, count)
+        names, cum_weights = pool
+        return rng.choices(names, cum_weights=cum_weights, k=count)
+
+    def _blocks(self, count):
+        """Erzeuge die Lieder in Blöcken fester Größe mit je einem eigenen Zufallsgenerator."""
+        reservoir = []
+        seen = 0
+        for index, start in enumerate(range(0, count, BLOCK_SIZE)):
+            size = min(BLOCK_SIZE, count - start)
+            rng = random.Random((self.block_seed << 32) + index)
+            block = list(zip(self._random_strings(rng, size, self.title_lengths),
+                             self._pick(rng, self.artists, size),
+                             self._pick(rng, self.albums, size)))
+
+            if self.duplicate_rate > 0:
+                for i in range(size):
+                    if reservoir and rng.random() < self.duplicate_rate:
+                        # Ersetze das Lied durch ein bereits erzeugtes Lied
+                        block[i] = rng.choice(reservoir)
+                    # Algorithmus R: gleichverteilte Stichprobe über alle bisherigen Lieder
+                    seen += 1
+                    if len(reservoir) < RESERVOIR_SIZE:
+                        reservoir.append(block[i])
+                    else:
+                        j = rng.randrange(seen)
+                        if j < RESERVOIR_SIZE:
+                            reservoir[j] = block[i]
+
+            yield block
+
+    def _random_chunks(self, count):
+        """Fasse die erzeugten Lieder zu Blöcken der Größe chunk_size zusammen."""
+        songs = itertools.chain.from_iterable(self._blocks(count))
+        while True:
+            chunk = list(itertools.islice(songs, self.chunk_size))
+            if not chunk:
+                break
+            yield chunk
+
+    def _sorted_chunks(self, count, reverse):
+        """Sortiere die Lieder extern: sortierte Blöcke auf die Platte, danach mischen."""
+        chunks = self._random_chunks(count)
+        # Passt alles in einen Block, wird direkt im Speicher sortiert
+        if count <= self.chunk_size:
+            for chunk in chunks:
+                chunk.sort(reverse=reverse)
+                yield chunk
+            return
+
+        with tempfile.TemporaryDirectory(prefix="songs_") as directory:
+            paths = []
+            for chunk in chunks:
+                # Tupel werden wie Song-Objekte nach Titel, Künstler und Album verglichen
+                chunk.sort(reverse=reverse)
+                paths.append(self._write_block(directory, len(paths), chunk))
+
+            # Mische in mehreren Durchgängen, damit nie zu viele Dateien gleichzeitig offen sind
+            passes = 0
+            while len(paths) > MERGE_FAN_IN:
+                passes += 1
+                merged_paths = []
+                for i in range(0, len(paths), MERGE_FAN_IN):
+                    group = paths[i:i + MERGE_FAN_IN]
+                    name = f"pass_{passes}_{len(merged_paths)}"
+                    merged_paths.append(self._write_block(directory, name, self._merge_files(group, reverse)))
+                    for path in group:
+                        os.remove(path)
+                paths = merged_paths
+
+            merged = self._merge_files(paths, reverse)
+            while True:
+                chunk = list(itertools.islice(merged, self.chunk_size))
+                if not chunk:
+                    break
+                yield chunk
+
+    def _write_block(self, directory, name, songs):
+        """Schreibe sortierte Lieder in eine temporäre Blockdatei und gib deren Pfad zurück."""
+        path = os.path.join(directory, f"block_{name}.csv")
+        with open(path, 'w') as file:
+            file.writelines(f"{title},{artist},{album}\n" for title, artist, album in songs)
+        return path
+
+    def _merge_files(self, paths, reverse):
+        """Mische mehrere sortierte Blockdateien zu einem sortierten Strom."""
+        files = [open(path, 'r') for path in paths]
+        try:
+            readers = [(tuple(line.rstrip('\n').split(',')) for line in file) for file in files]
+            yield from heapq.merge(*readers, reverse=reverse)
+        finally:
+            for file in files:
+                file.close()
+
+    def chunks(self, count):
+        """Erzeuge die Lieder als Blöcke von (Titel, Künstler, Album)-Tupeln."""
+        if count < 0:
+            raise ValueError("Die Anzahl der Lieder darf nicht negativ sein.")
+        if self.order == "random":
+            return self._random_chunks(count)
+        return self._sorted_chunks(count, reverse=self.order == "reversed")
+
+    def generate(self, count):
+        """Erzeuge die Lieder einzeln als (Titel, Künstler, Album)-Tupel."""
+        return itertools.chain.from_iterable(self.chunks(count))
+
+    def write_csv(self, count, filename="songs.csv"):
+        """Schreibe die Lieder blockweise im Format von songs.csv in eine Datei."""
+        chunks = self.chunks(count)
+        written = 0
+        # Schreibe zuerst in eine temporäre Datei im Zielverzeichnis, damit eine bestehende
+        # Bibliothek bei einem Fehler oder Abbruch erhalten bleibt
+        directory = os.path.dirname(os.path.abspath(filename))
+        handle, temp_filename = tempfile.mkstemp(prefix=".songs_", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(handle, 'w') as file:
+                for chunk in chunks:
+                    file.write(''.join(f"{title},{artist},{album}\n" for title, artist, album in chunk))
+                    written += len(chunk)
+            # mkstemp legt die Datei nur für den Besitzer lesbar an, übernimm daher die üblichen Rechte
+            if os.path.exists(filename):
+                shutil.copymode(filename, temp_filename)
+            else:
+                os.chmod(temp_filename, 0o644)
+            os.replace(temp_filename, filename)
+        except BaseException:
+            os.remove(temp_filename)
+            raise
+        return written
+
+
+def main(argv=None):
+    """Kommandozeile zum Erzeugen einer synthetischen Musikbibliothek."""
+    parser = argparse.ArgumentParser(description="Erzeuge eine synthetische Musikbibliothek für Lasttests.")
+    parser.add_argument("count", type=int, help="Anzahl der zu erzeugenden Lieder")
+    parser.add_argument("--output", default="songs.csv", help="Zieldatei (Standard: songs.csv)")
+    parser.add_argument("--seed", type=int, help="Seed für reproduzierbare Bibliotheken")
+    parser.add_argument("--artists", type=int, help="Anzahl unterschiedlicher Künstler (Standard: jeder Song neu)")
+    parser.add_argument("--albums", type=int, help="Anzahl unterschiedlicher Alben (Standard: jeder Song neu)")
+    parser.add_argument("--skew", type=float, default=1.0,
+                        help="Zipf-Exponent für die Wiederverwendung von Künstlern und Alben (Standard: 1.0)")
+    parser.add_argument("--min-length", type=int, default=5,
+                        help="Minimale Titellänge (Standard: 5, Künstler und Alben haben 5 bis 10 Zeichen)")
+    parser.add_argument("--max-length", type=int, default=10, help="Maximale Titellänge (Standard: 10)")
+    parser.add_argument("--duplicate-rate", type=float, default=0.0,
+                        help="Anteil der Lieder, die ein früheres Lied wiederholen (Standard: 0.0)")
+    parser.add_argument("--order", choices=ORDERS, default="random", help="Reihenfolge der Lieder")
+    parser.add_argument("--chunk-size", type=int, default=100000,
+                        help="Anzahl der Lieder pro Block im Speicher (Standard: 100000)")
+    args = parser.parse_args(argv)
+    if args.count < 0:
+        parser.error("Die Anzahl der Lieder darf nicht negativ sein.")
+
+    try:
+        generator = SongGenerator(seed=args.seed, artist_count=args.artists, album_count=args.albums,
+                                  skew=args.skew, min_length=args.min_length, max_length=args.max_length,
+                                  duplicate_rate=args.duplicate_rate, order=args.order,
+                                  chunk_size=args.chunk_size)
+    except ValueError as e:
+        # Ungültige Parameter werden wie andere Argumentfehler als Nutzungsfehler gemeldet
+        parser.error(str(e))
+    start = time.perf_counter()
+    written = generator.write_csv(args.count, args.output)
+    duration = time.perf_counter() - start
+    print(f"{written} Lieder in {duration:.3f} s nach {args.output} geschrieben.")
+
+
+if __name__ == "__main__":
+    main()